@@ -16,15 +16,27 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import json
+import io
 import os
-import atexit
+import functools
 from gi.repository import Gtk, GLib
 
 class SettingsApplier:
-    SETTINGS_FILE = "/tmp/clockspeeds_settings.json"
     APPLY_SCRIPT_PATH = "/usr/local/bin/apply_clockspeeds_settings.sh"
     SERVICE_PATH = "/etc/systemd/system/clockspeeds.service"
+    SERVICE_CONTENT = f"""[Unit]
+Description=Apply ClockSpeeds settings
+
+[Service]
+Type=oneshot
+ExecStart={APPLY_SCRIPT_PATH}
+TimeoutSec=0
+RemainAfterExit=yes
+
+[Install]
+WantedBy=multi-user.target
+"""
+    TEE_LINE = "echo %s | tee %s > /dev/null\n"  # Apply script template, filled with % formatting
 
     def __init__(self, logger, global_state, gui_components, widget_factory, cpu_file_search, privileged_actions):
         # References to instances
@@ -35,15 +47,21 @@ class SettingsApplier:
         self.cpu_file_search = cpu_file_search
         self.privileged_actions = privileged_actions
 
-        self.applied_settings = {}
+        self.applied_settings = {}  # Command settings applied this session, used to build the apply script
         self.settings_applied = False  # Track if any settings have been applied
         self.settings_applied_on_boot = False  # Track if any settings have been applied across startups
+        self.boot_checkbutton_sensitive = None  # Last sensitivity set on the Apply On Boot checkbutton
+        self.pbo_core_masks = None  # Per-core SMU argument bits, computed on the first PBO command
 
-        atexit.register(self.cleanup)
+        # The CPU type is known once the file search is done, pick the matching boost writer up front
+        if self.cpu_file_search.cpu_type == "Other":
+            self.write_boost_command = self.write_per_thread_boost_command
+        else:
+            self.write_boost_command = self.write_intel_boost_command
 
     def initialize_settings_file(self):
         try:
-            # Check if the apply script or systemd service exists
+            # Check once if the apply script or systemd service exists, settings_applied_on_boot tracks it afterwards
             if os.path.exists(self.APPLY_SCRIPT_PATH) or os.path.exists(self.SERVICE_PATH):
                 self.logger.info("Apply script or systemd service found, enabling Apply On Boot checkbutton.")
                 self.settings_applied_on_boot = True
@@ -52,69 +70,42 @@ class SettingsApplier:
                 self.global_state.ignore_boot_checkbutton_toggle = False
             else:
                 self.logger.info("No apply script or systemd service found.")
-
-            # Check if the tmp command settings file still exists, if so delete it and create a new one
-            if os.path.exists(self.SETTINGS_FILE):
-                os.remove(self.SETTINGS_FILE)
-                self.logger.info("Old command settings file deleted.")
-            with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump({}, f)
-            self.logger.info("New command settings file created.")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize command settings file: {e}")
-
-    def cleanup(self):
-        # Delete the tmp command settings file on exit
-        try:
-            if os.path.exists(self.SETTINGS_FILE):
-                os.remove(self.SETTINGS_FILE)
-                self.logger.info("Command settings file deleted.")
         except Exception as e:
-            self.logger.error(f"Failed to delete command settings file: {e}")
+            self.logger.error(f"Failed to initialize command settings: {e}")
 
     def setup_gui_components(self):
         try:
             self.checked_threads = self.gui_components['cpu_max_min_checkbuttons']
             self.min_scales = self.gui_components['cpu_min_scales']
             self.max_scales = self.gui_components['cpu_max_scales']
-            self.governor_combobox = self.gui_components['governor_combobox']
+            self.governor_dropdown = self.gui_components['governor_dropdown']
             self.boost_checkbutton = self.gui_components['boost_checkbutton']
             self.tdp_scale = self.gui_components['tdp_scale']
             self.pbo_curve_scale = self.gui_components['pbo_curve_scale']
-            self.epb_combobox = self.gui_components['epb_combobox']
+            self.epb_dropdown = self.gui_components['epb_dropdown']
             self.settings_window = self.gui_components['settings_window']
             self.apply_on_boot_checkbutton = self.gui_components['apply_on_boot_checkbutton']
         except KeyError as e:
             self.logger.error(f"Error setting up apply_settings gui_components: Component {e} not found")
 
-    def load_settings(self):
-        try:
-            with open(self.SETTINGS_FILE, 'r') as f:
-                self.settings = json.load(f)
-            self.logger.info("Command settings loaded.")
-        except FileNotFoundError:
-            self.logger.info("Command settings file not found.")
-            self.settings = {}
-        except Exception as e:
-            self.logger.error(f"Failed to load command settings: {e}")
-            self.settings = {}
-
     def save_settings(self):
         try:
-            with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump(self.applied_settings, f)
-                self.settings_applied = True
-                self.update_checkbutton_sensitivity()
+            # The applied settings stay in memory, only the checkbutton state needs updating
+            self.settings_applied = True
+            self.update_checkbutton_sensitivity()
             self.logger.info("Command settings saved successfully.")
         except Exception as e:
             self.logger.error(f"Failed to save command settings: {e}")
 
+    def set_checkbutton_sensitivity(self, sensitive):
+        # Only call into GTK when the Apply On Boot checkbutton sensitivity actually changes
+        if self.boot_checkbutton_sensitive != sensitive:
+            self.apply_on_boot_checkbutton.set_sensitive(sensitive)
+            self.boot_checkbutton_sensitive = sensitive
+
     def update_checkbutton_sensitivity(self):
         try:
-            if self.settings_applied or self.settings_applied_on_boot:
-                self.apply_on_boot_checkbutton.set_sensitive(True)
-            else:
-                self.apply_on_boot_checkbutton.set_sensitive(False)
+            self.set_checkbutton_sensitivity(self.settings_applied or self.settings_applied_on_boot)
         except Exception as e:
             self.logger.error(f"Failed to update the Apply On Boot checkbutton sensitivity: {e}")
 
@@ -123,154 +114,173 @@ class SettingsApplier:
         self.apply_on_boot_checkbutton.set_active(self.global_state.previous_boot_checkbutton_state)
         self.global_state.ignore_boot_checkbutton_toggle = False
 
-    def create_apply_script(self):
+    def create_apply_script(self, script):
         try:
-            self.load_settings()  # Load settings before creating the script
+            # Stream each command line straight into the caller's buffer
+            write = script.write
+            write("#!/bin/bash\n")
+            header_length = script.tell()
+
+            self.logger.info(f"Loaded command settings: {self.applied_settings}")
 
-            commands = []
+            # Bind the lookups used inside the per-thread loops once
+            settings = self.applied_settings
+            thread_count = self.cpu_file_search.thread_count
+            cpu_files = self.cpu_file_search.cpu_files
+            governor_files = cpu_files['governor_files']
+            bias_files = cpu_files['epb_files']
 
-            self.logger.info(f"Loaded command settings: {self.settings}")
+            min_speeds = settings.get("min_speeds", {})
+            max_speeds = settings.get("max_speeds", {})
 
-            min_speeds = self.settings.get("min_speeds", {})
-            max_speeds = self.settings.get("max_speeds", {})
+            tee_line = self.TEE_LINE
 
-            for i in range(self.cpu_file_search.thread_count):
-                min_speed = min_speeds.get(str(i))
-                max_speed = max_speeds.get(str(i))
+            thread_speeds = {}
+            for i in range(thread_count):
+                min_speed = min_speeds.get(i)
+                max_speed = max_speeds.get(i)
                 self.logger.info(f"Thread {i}: min_speed={min_speed}, max_speed={max_speed}")
 
                 if min_speed is not None and max_speed is not None:
-                    max_file = self.cpu_file_search.cpu_files['scaling_max_files'].get(i)
-                    min_file = self.cpu_file_search.cpu_files['scaling_min_files'].get(i)
-                    if max_file and min_file:
-                        commands.append(f'echo {int(max_speed * 1000)} | tee {max_file} > /dev/null')
-                        commands.append(f'echo {int(min_speed * 1000)} | tee {min_file} > /dev/null')
-                    else:
-                        self.logger.error(f"Scaling min or max file not found for thread {i}")
-
-            governor = self.settings.get("governor")
+                    thread_speeds[i] = (min_speed, max_speed)
+
+            for speed, files in self.group_frequency_files(thread_speeds):
+                write(tee_line % (speed, " ".join(files)))
+
+            governor = settings.get("governor")
             if governor and governor != "Select Governor":
-                for i in range(self.cpu_file_search.thread_count):
-                    governor_file = self.cpu_file_search.cpu_files["governor_files"].get(i)
-                    if governor_file:
-                        commands.append(f'echo {governor} | tee {governor_file} > /dev/null')
-                    else:
-                        self.logger.error(f"Governor file not found for thread {i}")
-
-            boost = self.settings.get("boost")
+                governor_targets = self.collect_thread_files(governor_files, thread_count, "Governor")
+                if governor_targets:
+                    write(tee_line % (governor, " ".join(governor_targets)))
+
+            boost = settings.get("boost")
             if boost is not None:
-                if self.cpu_file_search.cpu_type == "Other":
-                    boost_value = '1' if boost else '0'
-                    for i in range(self.cpu_file_search.thread_count):
-                        boost_file = self.cpu_file_search.cpu_files["boost_files"].get(i)
-                        if boost_file:
-                            commands.append(f'echo {boost_value} | tee {boost_file} > /dev/null')
-                        else:
-                            self.logger.error(f"Boost file not found for thread {i}")
-                else:
-                    boost_value = '0' if boost else '1'
-                    boost_file = self.cpu_file_search.intel_boost_path
-                    if boost_file:
-                        commands.append(f'echo {boost_value} | tee {boost_file} > /dev/null')
-                    else:
-                        self.logger.error(f"Intel boost file not found")
-
-            tdp = self.settings.get("tdp")
+                self.write_boost_command(write, boost)
+
+            tdp = settings.get("tdp")
             if tdp is not None:
                 tdp_file = self.cpu_file_search.intel_tdp_files.get("tdp")
                 if tdp_file:
-                    commands.append(f'echo {int(tdp)} | tee {tdp_file} > /dev/null')
+                    write(tee_line % (int(tdp), tdp_file))
                 else:
                     self.logger.error("TDP file not found")
 
-            pbo_offset = self.settings.get("pbo_offset")
+            pbo_offset = settings.get("pbo_offset")
             if pbo_offset is not None:
-                commands.append(self.create_pbo_command(pbo_offset))
-
-            epb = self.settings.get("epb")
-            if epb and epb != "Select Energy Performance Bias":
-                bias_value = int(epb.split()[0])
-                for i in range(self.cpu_file_search.thread_count):
-                    bias_file = self.cpu_file_search.cpu_files["epb_files"].get(i)
-                    if bias_file:
-                        commands.append(f'echo {bias_value} | tee {bias_file} > /dev/null')
-                    else:
-                        self.logger.error(f"Intel energy_perf_bias files not found for thread {i}")
-
-            if not commands:
-                self.logger.error("No commands generated to execute.")
-                raise ValueError("No commands to execute.")
+                write(self.create_pbo_command(pbo_offset))
+                write('\n')
 
-            script_content = "#!/bin/bash\n" + "\n".join(commands)
+            # The numeric bias is parsed once when selected, only valid selections are stored
+            bias_value = settings.get("epb_value")
+            if bias_value is not None:
+                bias_targets = self.collect_thread_files(bias_files, thread_count, "Intel energy_perf_bias")
+                if bias_targets:
+                    write(tee_line % (bias_value, " ".join(bias_targets)))
 
-            # Write the script content to a temporary file
-            tmp_script_path = "/tmp/apply_clockspeeds_settings.sh"
-            with open(tmp_script_path, 'w') as f:
-                f.write(script_content)
+            if script.tell() == header_length:
+                self.logger.error("No commands generated to execute.")
+                raise ValueError("No commands to execute.")
 
-            self.logger.info("Command apply script created successfully in /tmp/")
+            self.logger.info("Command apply script created successfully.")
 
-            return tmp_script_path
+            return True
         except Exception as e:
             self.logger.error(f"Error creating command apply script: {e}")
-            return None
+            return False
+
+    def write_per_thread_boost_command(self, write, boost):
+        # Write the boost value to every thread's boost file
+        boost_value = '1' if boost else '0'
+        boost_targets = self.collect_thread_files(
+            self.cpu_file_search.cpu_files['boost_files'], self.cpu_file_search.thread_count, "Boost")
+        if boost_targets:
+            write(self.TEE_LINE % (boost_value, " ".join(boost_targets)))
+
+    def write_intel_boost_command(self, write, boost):
+        # Write the inverted boost value to the Intel no_turbo file
+        boost_value = '0' if boost else '1'
+        boost_file = self.cpu_file_search.intel_boost_path
+        if boost_file:
+            write(self.TEE_LINE % (boost_value, boost_file))
+        else:
+            self.logger.error("Intel boost file not found")
+
+    def group_frequency_files(self, thread_speeds):
+        # Group the scaling files by target frequency in kHz so each value is written only once,
+        # every max group comes before any min group to match the per-thread max-then-min order
+        scaling_max_files = self.cpu_file_search.cpu_files['scaling_max_files']
+        scaling_min_files = self.cpu_file_search.cpu_files['scaling_min_files']
+        max_targets = {}
+        min_targets = {}
+        for i, (min_speed, max_speed) in thread_speeds.items():
+            max_file = scaling_max_files[i]
+            min_file = scaling_min_files[i]
+            if max_file and min_file:
+                max_targets.setdefault(int(max_speed * 1000), []).append(max_file)
+                min_targets.setdefault(int(min_speed * 1000), []).append(min_file)
+            else:
+                self.logger.error(f"Scaling min or max file not found for thread {i}")
+        return [*max_targets.items(), *min_targets.items()]
+
+    def collect_thread_files(self, thread_files, thread_count, file_description):
+        # Gather the per-thread files in thread order and report any missing threads in one message
+        files = thread_files[:thread_count]
+        missing_threads = [i for i, file in enumerate(files) if not file]
+        if missing_threads:
+            self.logger.error(f"{file_description} file not found for threads {missing_threads}")
+        return [file for file in files if file]
 
     def create_pbo_command(self, offset_value):
         # Create the command to set the PBO curve offset value for all cores
-        commands = []
-        physical_cores = self.parse_cpu_info(self.cpu_file_search.proc_files['cpuinfo'])[2]
+        if not self.pbo_core_masks:
+            # The core addressing bits never change, compute them once for every physical core
+            self.pbo_core_masks = tuple(
+                ((core_id & 8) << 5 | core_id & 7) << 20
+                for core_id in range(self.cpu_file_search.get_physical_cores()))
+
+        return self.build_pbo_command(self.pbo_core_masks, offset_value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def build_pbo_command(core_masks, offset_value):
+        # Build the PBO command for the given cores and offset, repeated applies reuse the cached string
 
         # Convert the positive offset_value to a negative offset
         offset_value = -offset_value
 
-        # Convert offset_value to a 16-bit two's complement representation
-        if offset_value < 0:
-            offset_value = (1 << 16) + offset_value
+        # Masking a negative int yields its 16-bit two's complement representation
+        offset_bits = offset_value & 0xFFFF
 
-        for core_id in range(physical_cores):
-            # Calculate smu_args_value for each core
-            smu_args_value = ((core_id & 8) << 5 | core_id & 7) << 20 | (offset_value & 0xFFFF)
-            commands.append(f"echo {smu_args_value} | sudo tee /sys/kernel/ryzen_smu_drv/smu_args > /dev/null")
-            commands.append(f"echo '0x35' | sudo tee /sys/kernel/ryzen_smu_drv/mp1_smu_cmd > /dev/null")
-        return " && ".join(commands)
+        # Combine each core's mask with the offset and join the command pairs in a single pass
+        return " && ".join(
+            f"echo {core_mask | offset_bits} | sudo tee /sys/kernel/ryzen_smu_drv/smu_args > /dev/null && "
+            f"echo '0x35' | sudo tee /sys/kernel/ryzen_smu_drv/mp1_smu_cmd > /dev/null"
+            for core_mask in core_masks)
 
     def create_systemd_service(self):
         try:
-            tmp_script_path = self.create_apply_script()
-            if not tmp_script_path:
+            # Write both files through heredocs and set up the systemd service in a single privileged shell,
+            # generating the apply script directly inside the command buffer
+            command = io.StringIO()
+            command.write(
+                'set -e\n'
+                f"cat > {self.APPLY_SCRIPT_PATH} << 'CLOCKSPEEDS_SCRIPT_EOF'\n")
+            if not self.create_apply_script(command):
                 raise Exception("Failed to create command apply script")
-
-            service_content = f"""[Unit]
-Description=Apply ClockSpeeds settings
-
-[Service]
-Type=oneshot
-ExecStart=/usr/local/bin/apply_clockspeeds_settings.sh
-TimeoutSec=0
-RemainAfterExit=yes
-
-[Install]
-WantedBy=multi-user.target
-"""
-
-            # Write the service content to a temporary file
-            tmp_service_path = "/tmp/clockspeeds.service"
-            with open(tmp_service_path, 'w') as f:
-                f.write(service_content)
-
-            # Combine the commands for moving the files and setting up the systemd service
-            command = (
-                f'mv {tmp_service_path} {self.SERVICE_PATH} && '
-                f'mv {tmp_script_path} {self.APPLY_SCRIPT_PATH} && '
+            command.write(
+                'CLOCKSPEEDS_SCRIPT_EOF\n'
+                f"cat > {self.SERVICE_PATH} << 'CLOCKSPEEDS_SERVICE_EOF'\n"
+                f'{self.SERVICE_CONTENT}'
+                'CLOCKSPEEDS_SERVICE_EOF\n'
                 f'chmod +x {self.APPLY_SCRIPT_PATH} && '
                 'systemctl daemon-reload && '
-                'systemctl enable clockspeeds.service && '
-                'systemctl start clockspeeds.service')
+                'systemctl enable --now clockspeeds.service')
 
             # Define success and failure callbacks
             def success_callback():
                 self.logger.info("Systemd service created and started.")
                 self.global_state.previous_boot_checkbutton_state = True
+                self.settings_applied_on_boot = True
                 self.update_checkbutton_sensitivity()
                 self.created_systemd_info_window()
 
@@ -284,7 +294,7 @@ WantedBy=multi-user.target
 
 
             # Run the combined command with elevated privileges
-            self.privileged_actions.run_pkexec_command(command, success_callback=success_callback, failure_callback=failure_callback)
+            self.privileged_actions.run_pkexec_command(command.getvalue(), success_callback=success_callback, failure_callback=failure_callback)
 
         except Exception as e:
             self.logger.error(f"Error creating systemd service: {e}")
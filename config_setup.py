@@ -19,6 +19,7 @@
 import configparser
 from pathlib import Path
 import logging
+import atexit
 
 class ConfigManager:
     def __init__(self, config_dir=None, config_file='config.ini'):
@@ -31,16 +32,15 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.config_file_path = self.config_dir / config_file
 
-        # Ensure the configuration directory exists
-        try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            self.logger.error(f"Failed to create configuration directory: {e}")
-            raise
+        self.config = None  # Parsed configuration, loaded on first access
+        self.dirty = False  # Track unsaved changes made through set_setting
+        self.flush_source_id = None  # Pending idle flush, None when no flush is scheduled
+
+        atexit.register(self.flush)
 
     def load_config(self):
-        # Load the configuration file
-        self.config = configparser.ConfigParser()
+        # Load the configuration file, the stored values never use % interpolation so skip it on every lookup
+        self.config = configparser.ConfigParser(interpolation=None)
         try:
             if not self.config.read(self.config_file_path):
                 # Create a new configuration file if it doesn't exist
@@ -53,6 +53,8 @@ class ConfigManager:
     def save_config(self):
         # Save the current configuration to the file
         try:
+            # Create the configuration directory only once something needs to be written
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             with self.config_file_path.open('w') as configfile:
                 self.config.write(configfile)
             self.logger.info("Configuration saved successfully.")
@@ -60,9 +62,25 @@ class ConfigManager:
             self.logger.error(f"IOError while saving configuration: {e}")
             raise
 
+    def flush(self):
+        # Write the configuration once if there are unsaved changes
+        if not self.dirty:
+            return
+        try:
+            self.save_config()
+            self.dirty = False
+        except IOError:
+            pass  # save_config already logged it, keep the changes for the next flush
+
+    def on_flush_idle(self):
+        # Flush the changes collected since the idle callback was scheduled
+        self.flush_source_id = None
+        self.flush()
+        return False
+
     def get_setting(self, section, option, default=None):
         # Get a configuration setting, returning a default value if the setting is not found
-        if not hasattr(self, 'config'):
+        if self.config is None:
             self.load_config()
         try:
             return self.config.get(section, option, fallback=default)
@@ -71,15 +89,20 @@ class ConfigManager:
             return default
 
     def set_setting(self, section, option, value):
-        # Set a configuration setting and save it to the file
-        if not hasattr(self, 'config'):
+        # Set a configuration setting and schedule a save to the file
+        if self.config is None:
             self.load_config()
 
         try:
             if not self.config.has_section(section):
                 self.config.add_section(section)
             self.config.set(section, option, value)
-            self.save_config()
+            self.dirty = True
+            if self.flush_source_id is None:
+                # Coalesce a burst of changes into a single write on the next idle, GLib is only
+                # imported here so the config can still be read without it
+                from gi.repository import GLib
+                self.flush_source_id = GLib.idle_add(self.on_flush_idle)
         except configparser.Error as e:
             self.logger.error(f"Error setting '{option}' in section '{section}': {e}")
             raise
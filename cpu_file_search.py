@@ -18,15 +18,18 @@
 
 import os
 import json
+import glob
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class DirectoryCache:
     def __init__(self, logger):
         # Initialize the logger
         self.logger = logger
 
-        # Dictionary for the cache
-        self.cache = {}
-
         # Cache directory and file name
         self.cache_dir_path = os.path.join(os.path.expanduser("~"), ".cache", "ClockSpeeds")
         self.cache_file_path = os.path.join(self.cache_dir_path, "directory_cache.json")
@@ -44,36 +47,48 @@ class DirectoryCache:
     def save_directories_to_file(self, directories):
         # Save the discovered directories and file paths to the cache file
         try:
-            with open(self.cache_file_path, 'w') as cache_file:
-                json.dump(directories, cache_file)
+            # Serialize in memory first so the cache is written in a single call
+            if orjson:
+                data = orjson.dumps(directories, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(directories, separators=(',', ':')).encode()
+
+            # Write next to the cache file and swap it in so a partial write never leaves a broken cache
+            tmp_path = self.cache_file_path + '.tmp'
+            with open(tmp_path, 'wb') as cache_file:
+                cache_file.write(data)
+            os.replace(tmp_path, self.cache_file_path)
         except Exception as e:
             self.logger.error(f"Failed to save directories and file paths: {e}")
 
     def load_directories_from_file(self):
         # Load the discovered directories and file paths from the cache file
         try:
-            if os.path.exists(self.cache_file_path):
-                with open(self.cache_file_path, 'r') as cache_file:
-                    directories = json.load(cache_file)
-                    return directories
+            # Opening the file is the existence check, a missing cache just means discovery runs
+            with open(self.cache_file_path, 'rb') as cache_file:
+                data = cache_file.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Failed to load directories and file paths: {e}")
         return None
 
-    def add(self, path, subdirs, files):
-        # Add a directory and its contents to the cache
-        self.cache[path] = {'subdirs': subdirs, 'files': files}
-
-    def get(self, path):
-        # Retrieve cached directory information
-        return self.cache.get(path)
-
-    def clear(self):
-        # Clear the cache
-        self.cache = {}
-
-    def cached_directory_walk(self, base_path):
-        # Generator function that walks through directories using caching
+    def scan_directory(self, path, need_files=True):
+        # List the subdirectories and files of a single directory
+        subdirs, files = [], []
+        with os.scandir(path) as scanner:
+            for entry in scanner:
+                # Symlinked directories are not followed, so walks cannot loop and need no realpath checks
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif need_files:
+                    files.append(entry.name)
+        return subdirs, files
+
+    def cached_directory_walk(self, base_path, need_files=True, skip_dirs=()):
+        # Generator function that walks through directories, callers that only need dirs can skip files
+        # and subtrees named in skip_dirs are pruned
         stack = [base_path]
         seen_paths = set()  # To track paths and avoid loops
 
@@ -83,23 +98,9 @@ class DirectoryCache:
                 continue
             seen_paths.add(path)
 
-            cached = self.get(path)
-            if cached:
-                yield path, cached['subdirs'], cached['files']
-                continue
-
             try:
-                subdirs, files = [], []
-                with os.scandir(path) as scanner:
-                    for entry in scanner:
-                        if entry.is_dir(follow_symlinks=False):
-                            full_path = entry.path
-                            if os.path.realpath(full_path) not in seen_paths:
-                                subdirs.append(entry.name)
-                                stack.append(full_path)
-                        else:
-                            files.append(entry.name)
-                self.add(path, subdirs, files)
+                subdirs, files = self.scan_directory(path, need_files)
+                stack.extend(os.path.join(path, subdir) for subdir in subdirs if subdir not in skip_dirs)
                 yield path, subdirs, files
             except PermissionError:
                 continue
@@ -117,12 +118,6 @@ class CPUFileSearch:
         # Get the total number of CPU threads
         self.thread_count = os.cpu_count()
 
-        # Determine CPU type: 'Intel' or 'Other'
-        self.cpu_type = None
-
-        # CPU directory path
-        self.cpu_directory = None
-
         # File paths for various CPU files
         self.cpufreq_file_paths = {
             'governor_files': "scaling_governor",
@@ -138,10 +133,48 @@ class CPUFileSearch:
         # Path for package throttle time files
         self.package_throttle_time_file = "package_throttle_total_time_ms"
 
-        # Dictionary to hold found CPU files
-        self.cpu_files = {key: {} for key in self.cpufreq_file_paths.keys()}
-        self.cpu_files['package_throttle_time_files'] = {}
-        self.cpu_files['epb_files'] = {}
+        # Start with no discovered paths
+        self.reset_discovered_paths()
+
+        # File descriptor kept open on the stat file and the buffer it is read into, both are used on every refresh
+        self.stat_fd = None
+        self.stat_buf = bytearray(16384)
+
+        # File descriptors kept open on the polled sysfs files, keyed by path
+        self.polled_fds = {}
+
+        # Number of physical cores, parsed from cpuinfo on first use
+        self.physical_cores = None
+
+        # The sysfs layout only changes with the kernel or the CPU topology, so the cache is only reused for the same pair
+        self.cache_key = f"{os.uname().release}|{self.thread_count}"
+
+        # Load paths from cache
+        cached_directories = self.directory_cache.load_directories_from_file()
+        if cached_directories and cached_directories.get("cache_key") == self.cache_key:
+            try:
+                self.load_paths_from_cache(cached_directories)
+            except RuntimeError:
+                # Required cached paths are gone, search for them again
+                self.logger.warning("Cached CPU paths are no longer valid, searching again.")
+                self.reset_discovered_paths()
+                self.initialize_cpu_files()
+        else:
+            self.initialize_cpu_files()
+
+    def reset_discovered_paths(self):
+        # Set every discovered path back to its empty state so a new search starts clean
+
+        # Determine CPU type: 'Intel' or 'Other'
+        self.cpu_type = None
+
+        # CPU directory path
+        self.cpu_directory = None
+
+        # Found CPU files, one list per file type indexed by thread with None for missing files
+        self.cpu_files = {key: [None] * self.thread_count for key in self.cpufreq_file_paths.keys()}
+        self.cpu_files['package_throttle_time_files'] = [None] * self.thread_count
+        self.cpu_files['epb_files'] = [None] * self.thread_count
 
         # Path to the Intel boost file
         self.intel_boost_path = None
@@ -158,13 +191,6 @@ class CPUFileSearch:
         # Dictionary to hold cache size files
         self.cache_files = {}
 
-        # Load paths from cache
-        cached_directories = self.directory_cache.load_directories_from_file()
-        if cached_directories:
-            self.load_paths_from_cache(cached_directories)
-        else:
-            self.initialize_cpu_files()
-
     def load_paths_from_cache(self, cached_directories):
         # Load cached paths for various CPU files
         self.cpu_directory = cached_directories["cpu_directory"]
@@ -173,19 +199,37 @@ class CPUFileSearch:
         self.proc_files = cached_directories["proc_files"]
         self.intel_tdp_files = cached_directories["intel_tdp_files"]
         self.cache_files = cached_directories["cache_files"]
-        self.cpu_files = {key: {int(k): v for k, v in value.items()} for key, value in cached_directories["cpu_files"].items()}
+        # Thread files are stored as lists indexed by thread, pad or trim them to the thread count
+        self.cpu_files = {
+            key: (value + [None] * self.thread_count)[:self.thread_count]
+            for key, value in cached_directories["cpu_files"].items()}
         self.cpu_type = "Intel" if self.intel_boost_path else "Other"
 
-        # Validate the loaded paths
+        # Forget cached files that no longer exist, then validate the loaded paths
+        self.drop_missing_files()
         self.validate_loaded_paths()
 
+    def drop_missing_files(self):
+        # Check the cached files once at startup so the polling code can read them without existence checks
+        for files in self.cpu_files.values():
+            for i, path in enumerate(files):
+                if path and not os.path.exists(path):
+                    files[i] = None
+        for key, path in self.intel_tdp_files.items():
+            if path and not os.path.exists(path):
+                self.intel_tdp_files[key] = None
+        if self.package_temp_file and not os.path.exists(self.package_temp_file):
+            self.package_temp_file = None
+        if self.intel_boost_path and not os.path.exists(self.intel_boost_path):
+            self.intel_boost_path = None
+
     def validate_loaded_paths(self):
         # Validate that the necessary paths are loaded correctly
         errors = []
 
         if not self.cpu_directory:
             errors.append("CPU directory is not set.")
-        if not any(self.cpu_files['scaling_max_files'].values()):
+        if not any(self.cpu_files['scaling_max_files']):
             errors.append("Min or max frequency files are not set for any thread.")
         if not self.proc_files['stat']:
             errors.append("/proc/stat file is not set.")
@@ -206,19 +250,19 @@ class CPUFileSearch:
                 self.logger.warning('CPU directory is not set.')
                 return
 
-            # Initialize the search for all necessary CPU files
+            # Initialize the search for all necessary CPU files, the per-thread searches share one pass
+            is_intel = self.cpu_type == "Intel"
             for i in range(self.thread_count):
-                self.find_cpufreq_files(i)
-                self.find_thermal_throttle_files(i)
+                self.find_thread_files(i, is_intel)
             self.find_no_turbo_file()
             self.find_proc_files()
             self.find_thermal_file()
             self.find_intel_tdp_files()
             self.find_cache_files()
-            self.find_energy_perf_bias_files()
 
             # Save the paths to the cache
             directories_to_save = {
+                "cache_key": self.cache_key,
                 "cpu_directory": self.cpu_directory,
                 "cpu_files": self.cpu_files,
                 "intel_boost_path": self.intel_boost_path,
@@ -231,14 +275,97 @@ class CPUFileSearch:
         except Exception as e:
             self.logger.error(f"Error initializing CPU files: {e}")
 
-    def find_cpu_directory(self, base_path='/sys/'):
-        # Find the CPU directory by scanning the base path
+    def get_physical_cores(self):
+        # Parse the physical core count from the cpuinfo file once and reuse it
+        if self.physical_cores is None:
+            try:
+                physical_cores = 0
+                with open(self.proc_files['cpuinfo'], 'r') as file:
+                    for line in file:
+                        if line.startswith('cpu cores'):
+                            physical_cores = int(line.split(':')[1].strip())
+                            break
+                self.physical_cores = physical_cores
+            except Exception as e:
+                self.logger.error(f"Error reading physical cores from cpuinfo: {e}")
+                return 0
+        return self.physical_cores
+
+    def read_stat(self):
+        # Read the cpu lines of the stat file into a reused buffer through the kept open descriptor,
+        # reading stops at the interrupt counters that follow them since those can be far longer
+        if self.stat_fd is None:
+            if not self.proc_files['stat']:
+                return None
+            self.stat_fd = os.open(self.proc_files['stat'], os.O_RDONLY)
+        buf = self.stat_buf
+        size = 0
+        while True:
+            if size == len(buf):
+                buf.extend(bytes(len(buf)))  # The cpu lines did not fit, double the buffer
+            read_size = os.preadv(self.stat_fd, [memoryview(buf)[size:]], size)
+            if not read_size:
+                break
+            size += read_size
+            cpu_end = buf.find(b'\nintr', 0, size)
+            if cpu_end != -1:
+                size = cpu_end
+                break
+        return bytes(memoryview(buf)[:size])
+
+    def read_polled_file(self, path):
+        # Read a polled sysfs file through a kept open descriptor, sysfs regenerates the content on every read from offset 0
+        fd = self.polled_fds.get(path)
+        if fd is None:
+            fd = self.polled_fds[path] = os.open(path, os.O_RDONLY)
+        try:
+            return os.pread(fd, 256, 0).decode().strip()
+        except OSError:
+            # Drop the descriptor so the next poll opens the file again, it is only closed here
+            # if close_polled_files has not already taken it out of the map and closed it
+            if self.polled_fds.pop(path, None) == fd:
+                os.close(fd)
+            raise
+
+    def close_polled_files(self):
+        # Close the descriptors kept open for polling, the map is swapped out first so a speed read
+        # still running in the pool never sees a descriptor that is about to be closed
+        polled_fds, self.polled_fds = self.polled_fds, {}
+        for fd in polled_fds.values():
+            os.close(fd)
+        if self.stat_fd is not None:
+            os.close(self.stat_fd)
+            self.stat_fd = None
+
+    def read_sysfs_value(self, path):
+        # Read a short sysfs attribute with a single raw read, skipping the buffered text layer
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, 256).decode().strip()
+        finally:
+            os.close(fd)
+
+    def find_cpu_directory(self, known_path='/sys/devices/system/cpu'):
+        # Find the CPU directory, checking the standard location before its sibling system directories
         try:
-            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
-                if 'intel_pstate' in dirs and 'cpu' in root:
+            if os.path.isdir(os.path.join(known_path, 'intel_pstate')):
+                self.cpu_type = "Intel"
+                return known_path
+            if os.path.isdir(os.path.join(known_path, 'cpufreq')):
+                self.cpu_type = "Other"
+                return known_path
+
+            # The CPU directory always sits under the system directory, one listing of it replaces walking all of sysfs
+            system_path = os.path.dirname(known_path)
+            system_subdirs, _ = self.directory_cache.scan_directory(system_path, need_files=False)
+            for subdir in system_subdirs:
+                if 'cpu' not in subdir:
+                    continue
+                root = os.path.join(system_path, subdir)
+                if os.path.isdir(os.path.join(root, 'intel_pstate')):
                     self.cpu_type = "Intel"
                     return root
-                if 'cpufreq' in dirs and 'cpu' in root:
+                if os.path.isdir(os.path.join(root, 'cpufreq')):
                     self.cpu_type = "Other"
                     return root
         except Exception as e:
@@ -250,76 +377,67 @@ class CPUFileSearch:
         # Find the Intel no_turbo file if applicable
         try:
             if self.cpu_type == "Intel" and self.intel_boost_path is None:
-                intel_pstate_path = os.path.join(self.cpu_directory, 'intel_pstate')
-                for root, dirs, files in self.directory_cache.cached_directory_walk(intel_pstate_path):
-                    if 'no_turbo' in files:
-                        potential_path = os.path.join(root, 'no_turbo')
-                        self.intel_boost_path = potential_path
-                        self.cpu_files['boost_files'][0] = self.intel_boost_path
-                        return
+                potential_path = os.path.join(self.cpu_directory, 'intel_pstate', 'no_turbo')
+                if os.path.exists(potential_path):
+                    self.intel_boost_path = potential_path
+                    self.cpu_files['boost_files'][0] = self.intel_boost_path
+                    return
                 self.logger.warning('Intel no_turbo file does not exist.')
         except Exception as e:
             self.logger.error(f"Error finding no_turbo file: {e}")
 
+    def find_thread_files(self, thread_index, is_intel):
+        # Find every per-thread file in one visit, only cpufreq is listed and the Intel files are direct checks
+        self.find_cpufreq_files(thread_index)
+        if is_intel:
+            self.find_thermal_throttle_files(thread_index)
+            self.find_energy_perf_bias_files(thread_index)
+
     def find_cpufreq_files(self, thread_index):
         # Find cpufreq files for each CPU thread
         try:
             thread_cpufreq_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "cpufreq")
-            found_files = 0
-            for root, dirs, files in self.directory_cache.cached_directory_walk(thread_cpufreq_directory):
-                for file_key, file_name in self.cpufreq_file_paths.items():
-                    if file_name in files:
-                        file_path = os.path.join(root, file_name)
-                        self.cpu_files[file_key][thread_index] = file_path
-                        found_files += 1
-                if found_files == len(self.cpufreq_file_paths):
-                    return
-
-            if found_files < len(self.cpufreq_file_paths):
-                for file_key, file_name in self.cpufreq_file_paths.items():
-                    if not self.cpu_files[file_key].get(thread_index):
-                        if not (self.cpu_type == "Intel" and file_name == "boost"):
-                            self.logger.warning(f'File {file_name} for thread {thread_index} does not exist at {thread_cpufreq_directory}.')
+            # The cpufreq files all sit directly in the directory, one listing answers every lookup
+            try:
+                file_names = set(self.directory_cache.scan_directory(thread_cpufreq_directory)[1])
+            except FileNotFoundError:
+                file_names = set()
+
+            # Every path shares the directory prefix, build it once instead of joining per file
+            path_prefix = thread_cpufreq_directory + os.sep
+            for file_key, file_name in self.cpufreq_file_paths.items():
+                if file_name in file_names:
+                    self.cpu_files[file_key][thread_index] = path_prefix + file_name
+                elif not (self.cpu_type == "Intel" and file_name == "boost"):
+                    self.logger.warning(f'File {file_name} for thread {thread_index} does not exist at {thread_cpufreq_directory}.')
 
         except Exception as e:
             self.logger.error(f"Error finding cpufreq files for thread {thread_index}: {e}")
 
     def find_thermal_throttle_files(self, thread_index):
-        # Find thermal throttle files for Intel CPUs
+        # Find thermal throttle files for an Intel CPU thread
         try:
-            if self.cpu_type == "Intel":
-                thread_thermal_throttle_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "thermal_throttle")
-                file_found = False
-                for root, dirs, files in self.directory_cache.cached_directory_walk(thread_thermal_throttle_directory):
-                    if self.package_throttle_time_file in files:
-                        throttle_file_path = os.path.join(root, self.package_throttle_time_file)
-                        self.cpu_files['package_throttle_time_files'][thread_index] = throttle_file_path
-                        file_found = True
-                        break
-                if not file_found:
-                    self.logger.warning(f'Throttle file {self.package_throttle_time_file} for thread {thread_index} does not exist at {thread_thermal_throttle_directory}.')
-                    
+            thread_thermal_throttle_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "thermal_throttle")
+            throttle_file_path = os.path.join(thread_thermal_throttle_directory, self.package_throttle_time_file)
+            if os.path.exists(throttle_file_path):
+                self.cpu_files['package_throttle_time_files'][thread_index] = throttle_file_path
+            else:
+                self.logger.warning(f'Throttle file {self.package_throttle_time_file} for thread {thread_index} does not exist at {thread_thermal_throttle_directory}.')
+
         except Exception as e:
             self.logger.error(f"Error finding thermal throttle files for thread {thread_index}: {e}")
 
     def find_proc_files(self, base_path='/proc/'):
         # Find necessary /proc files
         proc_file_names = ['stat', 'cpuinfo', 'meminfo']
-        need_to_find = set(proc_file_names)
         try:
-            found_files = 0
-            for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
-                for file_name in list(need_to_find):
-                    if file_name in files:
-                        self.proc_files[file_name] = os.path.join(root, file_name)
-                        need_to_find.remove(file_name)
-                        found_files += 1
-                if found_files == len(proc_file_names):
-                    return
-
-            if found_files < len(proc_file_names):
-                for file_name in need_to_find:
-                    self.logger.warning(f'{file_name} file not found in /proc/')
+            # The proc files live directly under the base path, no need to scan it
+            for file_name in proc_file_names:
+                file_path = os.path.join(base_path, file_name)
+                if os.path.exists(file_path):
+                    self.proc_files[file_name] = file_path
+                else:
+                    self.logger.warning(f'{file_name} file not found in {base_path}')
 
         except Exception as e:
             self.logger.error(f"Error searching for proc files: {e}")
@@ -327,33 +445,52 @@ class CPUFileSearch:
     def find_thermal_file(self):
         # Find CPU thermal files
         potential_paths = ['/sys/class/', '/sys/devices/']
+        # Device subtrees that never hold CPU temperature sensors are left out of the fallback scan
+        skip_dirs = frozenset(('block', 'net', 'bluetooth', 'drm', 'tty', 'input', 'sound'))
+        # The CPU type does not change during the search, pick the label keywords once
+        label_keywords = ('package', 'cpu') if self.cpu_type == 'Intel' else ('tctl',)
         try:
+            # Check the hwmon devices directly before falling back to scanning sysfs
+            for hwmon_path in sorted(glob.iglob('/sys/class/hwmon/hwmon*')):
+                try:
+                    hwmon_files = sorted(os.listdir(hwmon_path))
+                except OSError:
+                    continue
+                temp_file = self.find_relevant_temp_input(hwmon_path, hwmon_files, label_keywords)
+                if not temp_file and self.cpu_type != 'Intel' and 'temp1_input' in hwmon_files and 'name' in hwmon_files:
+                    # Older k10temp drivers expose Tctl as an unlabeled temp1_input, identify the chip by name instead
+                    if self.read_sysfs_value(os.path.join(hwmon_path, 'name')) == 'k10temp':
+                        temp_file = os.path.join(hwmon_path, 'temp1_input')
+                if temp_file:
+                    self.package_temp_file = temp_file
+                    return
+
             for base_path in potential_paths:
-                for root, dirs, files in self.directory_cache.cached_directory_walk(base_path):
-                    for file in files:
-                        if file.startswith('temp') and file.endswith('_input'):
-                            full_path = os.path.join(root, file)
-                            label_path = file.replace('_input', '_label')
-                            full_label_path = os.path.join(root, label_path)
-                            if os.path.exists(full_label_path):
-                                with open(full_label_path, 'r') as label_file:
-                                    label = label_file.read().strip().lower()
-                                    if self.is_relevant_temp_file(label):
-                                        self.package_temp_file = full_path
-                                        return
+                for root, dirs, files in self.directory_cache.cached_directory_walk(base_path, skip_dirs=skip_dirs):
+                    temp_file = self.find_relevant_temp_input(root, files, label_keywords)
+                    if temp_file:
+                        self.package_temp_file = temp_file
+                        return
         except IOError as e:
             self.logger.error(f"IOError while finding other thermal files: {e}")
         except Exception as e:
             self.logger.error(f"Error finding other thermal files: {e}")
         self.logger.warning('No thermal files found for CPU temperature monitoring.')
 
-    def is_relevant_temp_file(self, label):
-        # Determine if a temperature file is relevant
-        return (self.cpu_type == 'Intel' and ('package' in label or 'cpu' in label)) or \
-               (self.cpu_type != 'Intel' and 'tctl' in label)
+    def find_relevant_temp_input(self, root, files, label_keywords):
+        # Return the temp input file whose label matches the CPU, matching labels against the listed names without a stat
+        file_names = set(files)
+        for file in files:
+            if file.startswith('temp') and file.endswith('_input'):
+                label_file = file[:-len('_input')] + '_label'
+                if label_file in file_names:
+                    label = self.read_sysfs_value(os.path.join(root, label_file)).lower()
+                    if any(keyword in label for keyword in label_keywords):
+                        return os.path.join(root, file)
+        return None
 
-    def find_intel_tdp_files(self):
-        # Find Intel TDP files if applicable
+    def find_intel_tdp_files(self, rapl_path='/sys/class/powercap/intel-rapl:0'):
+        # Find Intel TDP files if applicable, the package RAPL domain has a fixed powercap path
         if self.cpu_type != "Intel":
             return
 
@@ -362,21 +499,10 @@ class CPUFileSearch:
             'max_tdp': 'constraint_0_max_power_uw'
         }
         try:
-            for root, dirs, files in os.walk('/sys/'):
-                if 'intel-rapl:0' in root:
-                    cached = self.directory_cache.get(root)
-                    if not cached:
-                        self.directory_cache.add(root, dirs, files)
-                    else:
-                        files = cached['files']
-
-                    found_files = 0
-                    for key, file_name in tdp_file_names.items():
-                        if file_name in files:
-                            self.intel_tdp_files[key] = os.path.join(root, file_name)
-                            found_files += 1
-                    if found_files == len(tdp_file_names):
-                        return
+            for key, file_name in tdp_file_names.items():
+                file_path = os.path.join(rapl_path, file_name)
+                if os.path.exists(file_path):
+                    self.intel_tdp_files[key] = file_path
         except Exception as e:
             self.logger.error(f"Error finding Intel TDP control file: {e}")
 
@@ -390,38 +516,32 @@ class CPUFileSearch:
             base_path = os.path.join(self.cpu_directory, 'cpu0')  # Starting with cpu0 for simplicity
             cache_path = os.path.join(base_path, 'cache')
             try:
-                for root, dirs, files in self.directory_cache.cached_directory_walk(cache_path):
-                    for dir_name in dirs:
-                        cache_index_path = os.path.join(root, dir_name)
-                        size_file = os.path.join(cache_index_path, 'size')
-                        level_file = os.path.join(cache_index_path, 'level')
-                        type_file = os.path.join(cache_index_path, 'type')
-                        if os.path.exists(size_file) and os.path.exists(level_file) and os.path.exists(type_file):
-                            with open(level_file, 'r') as lf, open(type_file, 'r') as tf, open(size_file, 'r') as sf:
-                                level = lf.read().strip()
-                                type_ = tf.read().strip()
-                                size = sf.read().strip()
-                                self.cache_files[f"{level}_{type_}"] = size
+                # List the cache directory once and each indexN directory once instead of checking every file
+                cache_subdirs, _ = self.directory_cache.scan_directory(cache_path, need_files=False)
+                for index_dir in sorted(cache_subdirs):
+                    if not index_dir.startswith('index'):
+                        continue
+                    cache_index_path = os.path.join(cache_path, index_dir)
+                    _, index_files = self.directory_cache.scan_directory(cache_index_path)
+                    if {'size', 'level', 'type'}.issubset(index_files):
+                        level = self.read_sysfs_value(os.path.join(cache_index_path, 'level'))
+                        type_ = self.read_sysfs_value(os.path.join(cache_index_path, 'type'))
+                        size = self.read_sysfs_value(os.path.join(cache_index_path, 'size'))
+                        self.cache_files[f"{level}_{type_}"] = size
+            except FileNotFoundError:
+                self.logger.warning(f'Cache directory does not exist at {cache_path}.')
             except Exception as e:
                 self.logger.error(f"Error searching cache directory: {e}")
 
-    def find_energy_perf_bias_files(self):
-        # Find energy_perf_bias files for each CPU thread
-        if self.cpu_type != "Intel":
-            return
-        
+    def find_energy_perf_bias_files(self, thread_index):
+        # Find the energy_perf_bias file for an Intel CPU thread
         try:
-            for i in range(self.thread_count):
-                thread_power_directory = os.path.join(self.cpu_directory, f"cpu{i}", "power")
-                found_files = 0
-                for root, dirs, files in self.directory_cache.cached_directory_walk(thread_power_directory):
-                    if 'energy_perf_bias' in files:
-                        file_path = os.path.join(root, 'energy_perf_bias')
-                        self.cpu_files['epb_files'][i] = file_path
-                        found_files += 1
-                        break
-                if found_files == 0:
-                    self.logger.warning(f'Intel energy_perf_bias file for thread {i} does not exist at {thread_power_directory}.')
+            thread_power_directory = os.path.join(self.cpu_directory, f"cpu{thread_index}", "power")
+            file_path = os.path.join(thread_power_directory, 'energy_perf_bias')
+            if os.path.exists(file_path):
+                self.cpu_files['epb_files'][thread_index] = file_path
+            else:
+                self.logger.warning(f'Intel energy_perf_bias file for thread {thread_index} does not exist at {thread_power_directory}.')
 
         except Exception as e:
-            self.logger.error(f"Error finding Intel energy_perf_bias files for threads: {e}")
+            self.logger.error(f"Error finding Intel energy_perf_bias files for thread {thread_index}: {e}")
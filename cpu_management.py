@@ -17,7 +17,9 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import time
 import gi
+from concurrent.futures import ThreadPoolExecutor
 from gi.repository import Gtk, GLib
 
 class CPUManager:
@@ -46,6 +48,9 @@ class CPUManager:
         # Keep track of the previous loads to not update unnecessarily
         self.prev_loads = {}
 
+        # Text last shown by each updated label, so unchanged values are not passed to GTK again
+        self.label_texts = {}
+
         # Schedule monitor tasks on startup
         self.schedule_monitor_tasks()
 
@@ -76,10 +81,20 @@ class CPUManager:
             'userspace'
         ])
 
+        # CPU information and total RAM do not change while running, they are parsed once
+        self.cpu_info_cache = None
+        self.total_ram = None
+
         # Keep track if CPU is currently throttling
         self.prev_package_throttle_time = [None] * self.cpu_file_search.thread_count
         self.is_throttling = False  # Flag to indicate if throttling is occurring
 
+        # Reading scaling_cur_freq can stall on firmware calls, the first read decides if cpuinfo is used instead
+        self.speed_source_checked = False
+        self.use_cpuinfo_speeds = False
+        # Thread pool to overlap slow speed reads when cpuinfo has no speeds to fall back on
+        self.speed_read_pool = None
+
     def schedule_monitor_tasks(self):
         # Schedule the periodic tasks for the monitor tab with the specified update interval
         if self.monitor_task_id:
@@ -110,33 +125,35 @@ class CPUManager:
             self.update_cpu_load()
             self.update_clock_speeds()
             self.read_package_temperature()
+            # The governor can also be changed outside the app, reading it is a single pread so check it every tick
             self.get_current_governor()
             self.update_throttle()
         except Exception as e:
             self.logger.error("Failed to run monitor tasks: %s", e)
-
-        # Only reschedule if the task ID is still valid (i.e., periodic tasks haven't been stopped)
-        if self.monitor_task_id:
-            self.schedule_monitor_tasks()
-        return False  # Prevent automatic re-scheduling by GLib
+        return True  # Keep the timeout source running, stop_monitor_tasks removes it
 
     def run_control_tasks(self):
         # Execute the control tasks periodically
         try:
+            # Boost can also be changed outside the app, reading it is a single pread so check it every tick
             self.update_boost_checkbutton()
         except Exception as e:
             self.logger.error("Failed to run control tasks: %s", e)
-        if self.control_task_id:
-            self.schedule_control_tasks()
-        return False  # Prevent automatic re-scheduling by GLib
+        return True  # Keep the timeout source running, stop_control_tasks removes it
 
     def set_update_interval(self, interval):
         # Set the update interval for periodic tasks and save it in the config
-        self.update_interval = round(max(0.1, min(20.0, interval)), 1)
+        interval = round(max(0.1, min(20.0, interval)), 1)
+        if interval == self.update_interval:
+            return
+        self.update_interval = interval
         self.logger.info(f"Update interval set to {self.update_interval} seconds")
         self.config_manager.set_setting("Settings", "update_interval", f"{self.update_interval:.1f}")
-        self.schedule_monitor_tasks()
-        self.schedule_control_tasks()
+        # Only the running tasks need a new timeout source with the new interval
+        if self.monitor_task_id:
+            self.schedule_monitor_tasks()
+        if self.control_task_id:
+            self.schedule_control_tasks()
 
     def setup_gui_components(self):
         # Set up references to GUI components from the shared dictionary
@@ -207,7 +224,9 @@ class CPUManager:
             return None
 
     def parse_cpu_info(self, cpuinfo_file):
-        # Parse the CPU information file to extract model name and core counts
+        # Parse the CPU information file to extract model name and core counts, reusing an earlier result
+        if self.cpu_info_cache is not None:
+            return self.cpu_info_cache
         try:
             model_name = None  # To store the CPU model name
             # Dictionary to store cache sizes
@@ -217,47 +236,48 @@ class CPUManager:
                 "L2 Unified": self.cpu_file_search.cache_files.get("2_Unified", None),
                 "L3 Unified": self.cpu_file_search.cache_files.get("3_Unified", None)
             }
-            physical_cores = 0  # To store the number of physical cores
+            physical_cores = self.cpu_file_search.get_physical_cores()  # Cached number of physical cores
             virtual_cores = self.cpu_file_search.thread_count  # Number of virtual cores (threads)
 
-            # Open the cpuinfo file and read line by line
+            # Open the cpuinfo file and read only until the first model name
             with open(cpuinfo_file, 'r') as file:
                 for line in file:
-                    # Extract the model name
-                    if line.startswith('model name') and not model_name:
+                    if line.startswith('model name'):
                         model_name = line.split(':')[1].strip()
-                    # Extract the number of physical cores
-                    elif line.startswith('cpu cores') and not physical_cores:
-                        physical_cores = int(line.split(':')[1].strip())
+                        break
 
-            return model_name, cache_sizes, physical_cores, virtual_cores
+            self.cpu_info_cache = (model_name, cache_sizes, physical_cores, virtual_cores)
+            return self.cpu_info_cache
 
         except Exception as e:
             self.logger.error(f"Error parsing CPU info: {e}")
             return None
 
     def read_total_ram(self, meminfo_file):
-        # Read the total RAM from the meminfo file
-        total_ram = None
+        # Read the total RAM from the meminfo file once and reuse it
+        if self.total_ram is not None:
+            return self.total_ram
         try:
             with open(meminfo_file, 'r') as file:
                 for line in file:
                     if line.startswith('MemTotal'):
-                        total_ram = int(line.split()[1]) // 1024  # Convert to MB
+                        self.total_ram = int(line.split()[1]) // 1024  # Convert to MB
                         break
         except Exception as e:
             self.logger.error(f"Error reading meminfo file: {e}")
-        return total_ram
+        return self.total_ram
 
     def get_allowed_cpu_frequency(self):
         # Get the allowed CPU frequencies from the system files
         try:
             min_allowed_freqs = []
             max_allowed_freqs = []
+            cpuinfo_min_files = self.cpu_file_search.cpu_files['cpuinfo_min_files']
+            cpuinfo_max_files = self.cpu_file_search.cpu_files['cpuinfo_max_files']
 
             for i in range(self.cpu_file_search.thread_count):
-                min_freq_file = self.cpu_file_search.cpu_files['cpuinfo_min_files'].get(i)
-                max_freq_file = self.cpu_file_search.cpu_files['cpuinfo_max_files'].get(i)
+                min_freq_file = cpuinfo_min_files[i]
+                max_freq_file = cpuinfo_max_files[i]
 
                 if not min_freq_file or not max_freq_file:
                     self.logger.error(f"Min or max frequency file not found for thread {i}")
@@ -287,7 +307,7 @@ class CPUManager:
 
         # Get the allowed TDP values for Intel CPUs
         max_tdp_file = self.cpu_file_search.intel_tdp_files['max_tdp']
-        if not max_tdp_file or not os.path.exists(max_tdp_file):
+        if not max_tdp_file:
             self.logger.error("Intel Max TDP file not found.")
             return None
 
@@ -296,21 +316,72 @@ class CPUManager:
                 max_tdp_value_uw = int(f.read().strip())
                 max_tdp_value_w = max_tdp_value_uw / 1_000_000  # Convert from microwatts to watts
                 return max_tdp_value_w
-        except ValueError as e:
+        except (ValueError, OSError) as e:
             self.logger.error(f"Error reading TDP values: {e}")
             return None
 
     def read_cpu_speeds(self):
         # Read the current CPU speeds from the appropriate system files
+        if self.use_cpuinfo_speeds:
+            return self.read_cpuinfo_speeds()
+
+        start_time = time.perf_counter()
+        speed_files = self.cpu_file_search.cpu_files['speed_files']
+        if self.speed_read_pool:
+            speed_strs = self.speed_read_pool.map(self.read_speed_file, speed_files)
+        else:
+            speed_strs = map(self.read_speed_file, speed_files)
+
         speeds = []  # List to store the CPU speeds
-        for i in range(self.cpu_file_search.thread_count):
-            speed_file = self.cpu_file_search.cpu_files['speed_files'].get(i)
-            if speed_file and os.path.exists(speed_file):
-                with open(speed_file, 'r') as file:
-                    speed_str = file.read().strip()
-                    if speed_str:
-                        speed = int(speed_str) / 1000  # Convert to MHz
-                        speeds.append((i, speed))
+        for i, speed_str in enumerate(speed_strs):
+            if speed_str:
+                speed = int(speed_str) / 1000  # Convert to MHz
+                speeds.append((i, speed))
+
+        if not self.speed_source_checked:
+            self.check_speed_source(time.perf_counter() - start_time, len(speeds))
+        return speeds
+
+    def read_speed_file(self, speed_file):
+        # Read a single thread's speed file, returning None when the thread has none or it went offline
+        if speed_file:
+            try:
+                return self.cpu_file_search.read_polled_file(speed_file)
+            except OSError:
+                pass
+        return None
+
+    def check_speed_source(self, elapsed, read_count):
+        # Switch to the cpuinfo speeds when the sysfs files took more than half a millisecond per thread to read,
+        # or read the files concurrently if cpuinfo does not list a speed for every thread
+        self.speed_source_checked = True
+        if read_count and elapsed / read_count > 0.0005:
+            try:
+                if len(self.read_cpuinfo_speeds()) == read_count:
+                    self.use_cpuinfo_speeds = True
+                    self.logger.info(f"Reading clock speeds from cpuinfo, sysfs reads took {elapsed * 1000:.1f} ms")
+                    return
+            except Exception as e:
+                self.logger.error(f"Error reading clock speeds from cpuinfo: {e}")
+            self.speed_read_pool = ThreadPoolExecutor(max_workers=min(32, read_count))
+            self.logger.info(f"Reading clock speeds concurrently, sysfs reads took {elapsed * 1000:.1f} ms")
+
+    def shutdown_speed_read_pool(self):
+        # Release the speed read threads without waiting on a read that may still be stalled
+        if self.speed_read_pool:
+            self.speed_read_pool.shutdown(wait=False)
+            self.speed_read_pool = None
+
+    def read_cpuinfo_speeds(self):
+        # Read the speeds of all threads from the cpu MHz lines of the cpuinfo file in one pass
+        speeds = []
+        thread_index = None
+        with open(self.cpu_file_search.proc_files['cpuinfo'], 'r') as file:
+            for line in file:
+                if line.startswith('processor'):
+                    thread_index = int(line.split(':')[1])
+                elif line.startswith('cpu MHz') and thread_index is not None:
+                    speeds.append((thread_index, float(line.split(':')[1])))
         return speeds
 
     def update_clock_labels(self, speeds):
@@ -321,14 +392,20 @@ class CPUManager:
                 if self.global_state.display_ghz:
                     display_speed = speed / 1000
                     unit = "GHz"
-                    label.set_text(f"{display_speed:.2f} {unit}")
+                    self.set_label_text(label, f"{display_speed:.2f} {unit}")
                 else:
                     display_speed = speed
                     unit = "MHz"
-                    label.set_text(f"{display_speed:.0f} {unit}")
+                    self.set_label_text(label, f"{display_speed:.0f} {unit}")
             else:
                 self.logger.warning(f"No clock label found for thread {i}")
 
+    def set_label_text(self, label, text):
+        # Only pass the text to GTK when it differs from what the label already shows
+        if self.label_texts.get(label) != text:
+            label.set_text(text)
+            self.label_texts[label] = text
+
     def update_average_speed(self, speeds):
         # Update the average clock speed label in the GUI
         if speeds:
@@ -337,11 +414,11 @@ class CPUManager:
                 if self.global_state.display_ghz:
                     display_speed = average_speed / 1000
                     unit = "GHz"
-                    self.avg_clock_label.set_text(f"{display_speed:.2f} {unit}")
+                    self.set_label_text(self.avg_clock_label, f"{display_speed:.2f} {unit}")
                 else:
                     display_speed = average_speed
                     unit = "MHz"
-                    self.avg_clock_label.set_text(f"{display_speed:.0f} {unit}")
+                    self.set_label_text(self.avg_clock_label, f"{display_speed:.0f} {unit}")
             else:
                 self.logger.warning("Average clock label not found in GUI components")
         else:
@@ -358,43 +435,30 @@ class CPUManager:
 
     def read_stat_file(self):
         # Read the CPU statistics from the stat file
-        stat_file_path = self.cpu_file_search.proc_files['stat']
-        if not stat_file_path:
+        stat_data = self.cpu_file_search.read_stat()
+        if stat_data is None:
             print("Stat file not found.")
             return None
 
-        cpu_stats = []  # List to store the CPU statistics
-        with open(stat_file_path, 'r') as file:
-            for line in file:
-                if line.startswith('cpu'):
-                    fields = line.split()
-                    if len(fields) >= 5:
-                        cpu_stats.append((fields[0], int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4])))
+        cpu_stats = []  # List to store the CPU statistics as (cpu_id, total time, idle time)
+        for line in stat_data.splitlines():
+            if line.startswith(b'cpu'):
+                fields = line.split(None, 5)
+                if len(fields) >= 5:
+                    # int() parses the byte fields directly, the totals are summed once here instead of in every load calculation
+                    user, nice, system, idle = int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4])
+                    cpu_stats.append((fields[0].decode(), user + nice + system + idle, idle))
 
         return cpu_stats
 
     def calculate_load(self, prev_stat, curr_stat):
         # Calculate the CPU load based on previous and current statistics
-        def calc_load(data):
-            loads = {}  # Dictionary to store the load percentages for each CPU
-            (cpu_id, prev_user, prev_nice, prev_system, prev_idle), \
-            (_, curr_user, curr_nice, curr_system, curr_idle) = data
-
-            total_diff = (curr_user + curr_nice + curr_system + curr_idle) - \
-                         (prev_user + prev_nice + prev_system + prev_idle)
-            idle_diff = curr_idle - prev_idle
-
-            # Return a load value of 0 if there is no difference, implying no load change
-            if total_diff:
-                return (cpu_id, 100 * (total_diff - idle_diff) / total_diff)
-            else:
-                return (cpu_id, 0.0)
-
-        # Use map to apply calc_load function across the zipped lists of previous and current stats
-        loads = map(calc_load, zip(prev_stat, curr_stat))
-
-        # Convert the map result to a dictionary
-        return dict(loads)
+        loads = {}  # Dictionary to store the load percentages for each CPU
+        for (cpu_id, prev_total, prev_idle), (_, curr_total, curr_idle) in zip(prev_stat, curr_stat):
+            total_diff = curr_total - prev_total
+            # A load value of 0 is used if there is no difference, implying no load change
+            loads[cpu_id] = 100 * (total_diff - (curr_idle - prev_idle)) / total_diff if total_diff else 0.0
+        return loads
 
     def update_cpu_load(self):
         # Update the CPU load for all threads
@@ -416,26 +480,33 @@ class CPUManager:
             self.logger.error(f"Error updating CPU load: {e}")
 
     def update_load_history(self, loads):
+        cpu_load_history = self.cpu_load_history
         for cpu_id, load in loads.items():
             if cpu_id.startswith('cpu') and cpu_id != 'cpu':
                 thread_index = int(cpu_id[3:])
-                if thread_index in self.cpu_load_history:
-                    self.cpu_load_history[thread_index].pop(0)
-                    self.cpu_load_history[thread_index].append(load)
+                history = cpu_load_history.get(thread_index)
+                if history is not None:
+                    history.pop(0)
+                    history.append(load)
 
     def update_load_gui(self, loads):
         try:
             total_load = 0
             count = 0
+            cpu_graphs = self.cpu_graphs
+            usage_labels = self.usage_labels
+            set_label_text = self.set_label_text
             for cpu_id, load in loads.items():
                 if cpu_id.startswith('cpu') and cpu_id != 'cpu':
                     thread_index = int(cpu_id[3:])
-                    if thread_index in self.cpu_graphs:
-                        self.cpu_graphs[thread_index].update(load / 100)
-                    
-                    if thread_index in self.usage_labels:
-                        self.usage_labels[thread_index].set_text(f"{load:.1f}%")
-                    
+                    graph = cpu_graphs.get(thread_index)
+                    if graph is not None:
+                        graph.update(load / 100)
+
+                    usage_label = usage_labels.get(thread_index)
+                    if usage_label is not None:
+                        set_label_text(usage_label, f"{load:.1f}%")
+
                     total_load += load
                     count += 1
 
@@ -445,7 +516,7 @@ class CPUManager:
                     self.avg_usage_graph.update(avg_load / 100)
                 
                 if self.avg_usage_label:
-                    self.avg_usage_label.set_text(f"{avg_load:.1f}%")
+                    self.set_label_text(self.avg_usage_label, f"{avg_load:.1f}%")
         except Exception as e:
             self.logger.error(f"Error updating load GUI: {e}")
 
@@ -453,14 +524,16 @@ class CPUManager:
         # Read and parse the CPU package temperature
         try:
             if self.cpu_file_search.package_temp_file:
-                if os.path.exists(self.cpu_file_search.package_temp_file):
-                    with open(self.cpu_file_search.package_temp_file, 'r') as file:
-                        temp_str = file.read().strip()
-                        if temp_str.isdigit():
-                            temp_celsius = int(temp_str) / 1000  # Convert from millidegrees to degrees Celsius
-                            return temp_str, temp_celsius
-                        else:
-                            self.logger.error("Temperature reading is not a valid number.")
+                try:
+                    temp_str = self.cpu_file_search.read_polled_file(self.cpu_file_search.package_temp_file)
+                except FileNotFoundError:
+                    temp_str = None
+                if temp_str is not None:
+                    if temp_str.isdigit():
+                        temp_celsius = int(temp_str) / 1000  # Convert from millidegrees to degrees Celsius
+                        return temp_str, temp_celsius
+                    else:
+                        self.logger.error("Temperature reading is not a valid number.")
             self.logger.error("No package temperature file found.")
         except Exception as e:
             self.logger.error(f"Error parsing temperature file: {e}")
@@ -473,7 +546,7 @@ class CPUManager:
             if temp_celsius is not None:
                 package_temp_label = self.package_temp_label
                 if package_temp_label is not None:
-                    package_temp_label.set_text(f"{int(temp_celsius)} °C")
+                    self.set_label_text(package_temp_label, f"{int(temp_celsius)} °C")
                 else:
                     self.logger.warning("Package temperature not found in GUI components")
                 return temp_celsius
@@ -489,19 +562,26 @@ class CPUManager:
             self.is_throttling = False  # Reset the throttling flag initially
 
             if self.cpu_file_search.cpu_type == "Intel":
-                # Intel specific throttle file check
-                for i in range(self.cpu_file_search.thread_count):
-                    package_throttle_time_file = self.cpu_file_search.cpu_files.get('package_throttle_time_files', {}).get(i)
-
-                    if package_throttle_time_file and os.path.exists(package_throttle_time_file):
-                        with open(package_throttle_time_file, 'r') as file:
-                            current_throttle_time = int(file.read().strip())
-
-                        if self.prev_package_throttle_time[i] is not None:
-                            if current_throttle_time > self.prev_package_throttle_time[i]:
+                # Intel specific throttle file check, the lookups are bound once outside the per-thread loop
+                read_polled_file = self.cpu_file_search.read_polled_file
+                prev_package_throttle_time = self.prev_package_throttle_time
+                for i, package_throttle_time_file in enumerate(self.cpu_file_search.cpu_files['package_throttle_time_files']):
+                    if self.is_throttling:
+                        # The result cannot change anymore, skip the remaining reads and forget their counters
+                        # so they are primed again next tick instead of compared against stale values
+                        prev_package_throttle_time[i] = None
+                        continue
+                    if package_throttle_time_file:
+                        try:
+                            current_throttle_time = int(read_polled_file(package_throttle_time_file))
+                        except OSError:
+                            continue  # The thread may have gone offline, skip it for this refresh
+
+                        if prev_package_throttle_time[i] is not None:
+                            if current_throttle_time > prev_package_throttle_time[i]:
                                 self.is_throttling = True  # Set throttling flag if throttle time has increased
 
-                        self.prev_package_throttle_time[i] = current_throttle_time  # Update previous throttle time
+                        prev_package_throttle_time[i] = current_throttle_time  # Update previous throttle time
 
             if self.is_throttling:
                 # Update the label to indicate throttling
@@ -515,10 +595,12 @@ class CPUManager:
 
     def read_and_get_governor(self):
         # Read the current CPU governor from the system file
-        governor_file_path = self.cpu_file_search.cpu_files['governor_files'].get(0)
-        if governor_file_path and os.path.exists(governor_file_path):
-            with open(governor_file_path, 'r') as governor_file:
-                return governor_file.read().strip()
+        governor_file_path = self.cpu_file_search.cpu_files['governor_files'][0]
+        if governor_file_path:
+            try:
+                return self.cpu_file_search.read_polled_file(governor_file_path)
+            except FileNotFoundError:
+                pass
         return None
 
     def get_current_governor(self):
@@ -537,9 +619,10 @@ class CPUManager:
         try:
             # Gather all unique governors from available governor files
             self.global_state.unique_governors.clear()
+            available_governors_files = self.cpu_file_search.cpu_files['available_governors_files']
             for i in range(self.cpu_file_search.thread_count):
-                available_governors_file = self.cpu_file_search.cpu_files['available_governors_files'].get(i)
-                if available_governors_file and os.path.exists(available_governors_file):
+                available_governors_file = available_governors_files[i]
+                if available_governors_file:
                     try:
                         with open(available_governors_file, 'r') as file:
                             governors = file.read().strip().split()
@@ -559,12 +642,12 @@ class CPUManager:
             self.logger.error("Failed to update governor dropdown: %s", e)
 
     def find_boost_type(self):
-        # Determine which boost files are correct for your CPU type
-        if self.cpu_file_search.cpu_type == "Intel" and self.cpu_file_search.intel_boost_path and os.path.exists(self.cpu_file_search.intel_boost_path):
+        # Determine which boost files are correct for your CPU type, the paths were checked when they were found
+        if self.cpu_file_search.cpu_type == "Intel" and self.cpu_file_search.intel_boost_path:
             return self.read_boost_file(self.cpu_file_search.intel_boost_path, intel=True)
         else:
-            for boost_file in self.cpu_file_search.cpu_files['boost_files'].values():
-                if os.path.exists(boost_file):
+            for boost_file in self.cpu_file_search.cpu_files['boost_files']:
+                if boost_file:
                     return self.read_boost_file(boost_file)
             self.logger.info("No valid boost control files found.")
             self.boost_checkbutton.hide()
@@ -573,13 +656,12 @@ class CPUManager:
     def read_boost_file(self, file_path, intel=False):
         # Read the boost file to determine the current boost status
         try:
-            with open(file_path, 'r') as file:
-                content = file.read().strip()
-                if content in ['0', '1']:
-                    return content == ('0' if intel else '1')
-                else:
-                    self.logger.error(f"Unexpected content in boost file at {file_path}: {content}")
-                    return False
+            content = self.cpu_file_search.read_polled_file(file_path)
+            if content in ['0', '1']:
+                return content == ('0' if intel else '1')
+            else:
+                self.logger.error(f"Unexpected content in boost file at {file_path}: {content}")
+                return False
         except IOError as e:
             self.logger.info(f"Boost file not accessible at {file_path}: {e}")
             return False
@@ -628,19 +710,6 @@ class CPUManager:
                     self.logger.error(f"Invalid input: CPU speeds must be a number for thread {i}.")
                     return None, None
 
-            def get_frequency_commands(min_speed, max_speed, i):
-                min_frequency_in_khz = min_speed * 1000
-                max_frequency_in_khz = max_speed * 1000
-
-                max_file = self.cpu_file_search.cpu_files['scaling_max_files'].get(i)
-                min_file = self.cpu_file_search.cpu_files['scaling_min_files'].get(i)
-
-                if max_file and min_file:
-                    max_command = f'echo {max_frequency_in_khz} | tee {max_file} > /dev/null'
-                    min_command = f'echo {min_frequency_in_khz} | tee {min_file} > /dev/null'
-                    return max_command, min_command
-                return None, None
-
             def success_callback():
                 # Handle successful execution of pkexec command
                 self.logger.info("Successfully applied CPU clock speed limits.")
@@ -662,6 +731,8 @@ class CPUManager:
 
             any_active_checkbutton = False
 
+            thread_speeds = {}  # Speeds of the checked threads, grouped into tee commands by the settings applier
+
             set_apply_min_max_sensitivity()
 
             for i in range(self.cpu_file_search.thread_count):
@@ -676,15 +747,13 @@ class CPUManager:
                         continue  # Skip to the next thread if speeds are invalid
 
                     self.logger.info(f"Applying clock speed for thread {i}")
-                    max_command, min_command = get_frequency_commands(min_speed, max_speed, i)
-                    if max_command is None or min_command is None:
-                        self.logger.error(f"Failed to get frequency commands for thread {i}")
-                        continue  # Skip to the next thread if commands are invalid
-
-                    command_list.extend([max_command, min_command])
+                    thread_speeds[i] = (min_speed, max_speed)
                 else:
                     self.logger.info(f"Skipping clock speed for thread {i} as checkbutton is not active")
 
+            for frequency_in_khz, files in self.settings_applier.group_frequency_files(thread_speeds):
+                command_list.append(f'echo {frequency_in_khz} | tee {" ".join(files)} > /dev/null')
+
             if command_list:
                 full_command = ' && '.join(command_list)
                 self.privileged_actions.run_pkexec_command(full_command, success_callback=success_callback, failure_callback=failure_callback)
@@ -742,16 +811,17 @@ class CPUManager:
             def get_command_list(governor):
                 # Generate the command list to set the governor
                 command_list = []
-                for i in range(self.cpu_file_search.thread_count):
-                    governor_file = self.cpu_file_search.cpu_files['governor_files'].get(i)
-                    if governor_file:
-                        command_list.append(f'echo "{governor}" | sudo tee {governor_file} > /dev/null')
+                governor_targets = self.settings_applier.collect_thread_files(
+                    self.cpu_file_search.cpu_files['governor_files'], self.cpu_file_search.thread_count, "Governor")
+                if governor_targets:
+                    command_list.append(f'echo "{governor}" | sudo tee {" ".join(governor_targets)} > /dev/null')
                 return command_list
 
             def success_callback():
                 # Handle successful execution of pkexec command
                 self.logger.info(f"Successfully set governor to {selected_governor}")
                 self.governor_dropdown.set_sensitive(True)
+                self.get_current_governor()  # Show the new governor without waiting for the next read
                 try:
                     self.settings_applier.applied_settings["governor"] = selected_governor
                     self.settings_applier.save_settings()
@@ -812,11 +882,11 @@ class CPUManager:
                     command_list.append(f'echo {value} | sudo tee {self.cpu_file_search.intel_boost_path} > /dev/null')
                 else:
                     # For non-Intel CPUs, toggle the boost for each thread
-                    for i in range(self.cpu_file_search.thread_count):
-                        boost_file = self.cpu_file_search.cpu_files['boost_files'].get(i)
-                        if boost_file:
-                            value = '1' if is_enabled else '0'
-                            command_list.append(f'echo {value} | sudo tee {boost_file} > /dev/null')
+                    value = '1' if is_enabled else '0'
+                    boost_targets = self.settings_applier.collect_thread_files(
+                        self.cpu_file_search.cpu_files['boost_files'], self.cpu_file_search.thread_count, "Boost")
+                    if boost_targets:
+                        command_list.append(f'echo {value} | sudo tee {" ".join(boost_targets)} > /dev/null')
                 return command_list
 
             def success_callback():
@@ -994,25 +1064,6 @@ class CPUManager:
                     return False
                 return True
 
-            def create_pbo_command(offset_value):
-                # Create the command to set the PBO curve offset value for all cores
-                commands = []
-                physical_cores = self.parse_cpu_info(self.cpu_file_search.proc_files['cpuinfo'])[2]
-
-                # Convert the positive offset_value to a negative offset
-                offset_value = -offset_value
-
-                # Convert offset_value to a 16-bit two's complement representation
-                if offset_value < 0:
-                    offset_value = (1 << 16) + offset_value
-
-                for core_id in range(physical_cores):
-                    # Calculate smu_args_value for each core
-                    smu_args_value = ((core_id & 8) << 5 | core_id & 7) << 20 | (offset_value & 0xFFFF)
-                    commands.append(f"echo {smu_args_value} | sudo tee /sys/kernel/ryzen_smu_drv/smu_args > /dev/null")
-                    commands.append(f"echo '0x35' | sudo tee /sys/kernel/ryzen_smu_drv/mp1_smu_cmd > /dev/null")
-                return " && ".join(commands)
-
             def success_callback():
                 self.logger.info(f"Successfully set PBO curve offset using scale value.")
                 self.apply_pbo_button.set_sensitive(True)
@@ -1041,7 +1092,7 @@ class CPUManager:
             set_pbo_sensitivity()
 
             offset_value = int(self.pbo_curve_scale.get_value())
-            command = create_pbo_command(offset_value)
+            command = self.settings_applier.create_pbo_command(offset_value)
             self.privileged_actions.run_pkexec_command(command, success_callback=success_callback, failure_callback=failure_callback)
             return True
 
@@ -1066,11 +1117,10 @@ class CPUManager:
             def get_command_list(bias_value):
                 # Generate the command list to set the EPB
                 command_list = []
-                epb_files = self.cpu_file_search.cpu_files['epb_files']
-                for i in range(self.cpu_file_search.thread_count):
-                    bias_file = epb_files.get(i)
-                    if bias_file:
-                        command_list.append(f'echo "{bias_value}" | sudo tee {bias_file} > /dev/null')
+                bias_targets = self.settings_applier.collect_thread_files(
+                    self.cpu_file_search.cpu_files['epb_files'], self.cpu_file_search.thread_count, "Intel energy_perf_bias")
+                if bias_targets:
+                    command_list.append(f'echo "{bias_value}" | sudo tee {" ".join(bias_targets)} > /dev/null')
                 return command_list
 
             def success_callback():
@@ -1079,6 +1129,7 @@ class CPUManager:
                 self.epb_dropdown.set_sensitive(True)
                 try:
                     self.settings_applier.applied_settings["epb"] = selected_bias
+                    self.settings_applier.applied_settings["epb_value"] = bias_value
                     self.settings_applier.save_settings()
                 except Exception as e:
                     self.logger.error(f"Error saving the applied Intel EPB setting: {e}")
@@ -90,6 +90,8 @@ class ClockSpeedsApp(Gtk.Application):
         Gtk.Application.do_startup(self)
 
     def do_shutdown(self):
+        self.cpu_manager.shutdown_speed_read_pool()
+        self.cpu_file_search.close_polled_files()
         Gtk.Application.do_shutdown(self)
 
     def close_main_window(self, window):
@@ -499,6 +501,7 @@ class ClockSpeedsApp(Gtk.Application):
             # Block the signal handlers to prevent multiple calls to update_check_all_state
             self.initialization_complete = False
             self.debounce_timeout_id = None
+            self.updating_from_check_all = False
 
             window_width = 535
             box_width = 240
@@ -700,6 +703,10 @@ class ClockSpeedsApp(Gtk.Application):
             self.logger.error(f"Error updating CPU widgets: {e}")
 
     def debounced_update_check_all_state(self, delay=10):
+        # Ignore the toggles emitted while Check All is updating every thread at once
+        if self.updating_from_check_all:
+            return
+
         if self.debounce_timeout_id is not None:
             GLib.source_remove(self.debounce_timeout_id)
         
@@ -712,11 +719,12 @@ class ClockSpeedsApp(Gtk.Application):
             self.updating_from_check_all = True
 
             active = button.get_active()
-            for checkbutton in self.cpu_max_min_checkbuttons.values():
-                checkbutton.set_active(active)
-
-            # Reset flag after updating
-            self.updating_from_check_all = False
+            try:
+                for checkbutton in self.cpu_max_min_checkbuttons.values():
+                    checkbutton.set_active(active)
+            finally:
+                # Reset flag after updating
+                self.updating_from_check_all = False
         except Exception as e:
             self.logger.error(f"Error updating thread checkbuttons: {e}")
 
@@ -208,21 +208,22 @@ class ScaleManager:
                 min_scale.handler_block_by_func(self.update_min_max_labels)
                 max_scale.handler_block_by_func(self.update_min_max_labels)
 
-            # Set new values for all min and max scales
-            for min_scale, max_scale in zip(self.min_scales.values(), self.max_scales.values()):
-                if is_min_scale:
-                    if new_min_value > max_scale.get_value():
-                        max_scale.set_value(new_min_value)
-                    min_scale.set_value(new_min_value)
-                else:
-                    if new_max_value < min_scale.get_value():
-                        min_scale.set_value(new_max_value)
-                    max_scale.set_value(new_max_value)
-
-            # Unblock all signals and force a single redraw if necessary
-            for min_scale, max_scale in zip(self.min_scales.values(), self.max_scales.values()):
-                min_scale.handler_unblock_by_func(self.update_min_max_labels)
-                max_scale.handler_unblock_by_func(self.update_min_max_labels)
+            try:
+                # Set new values for all min and max scales
+                for min_scale, max_scale in zip(self.min_scales.values(), self.max_scales.values()):
+                    if is_min_scale:
+                        if new_min_value > max_scale.get_value():
+                            max_scale.set_value(new_min_value)
+                        min_scale.set_value(new_min_value)
+                    else:
+                        if new_max_value < min_scale.get_value():
+                            min_scale.set_value(new_max_value)
+                        max_scale.set_value(new_max_value)
+            finally:
+                # Always unblock the signals, even if setting a value failed
+                for min_scale, max_scale in zip(self.min_scales.values(), self.max_scales.values()):
+                    min_scale.handler_unblock_by_func(self.update_min_max_labels)
+                    max_scale.handler_unblock_by_func(self.update_min_max_labels)
         except Exception as e:
             self.logger.error(f"Error syncing scales: {e}")
 
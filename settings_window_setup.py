@@ -262,10 +262,10 @@ class SettingsWindow:
         if self.global_state.ignore_boot_checkbutton_toggle:
             return
         if checkbutton.get_active():
-            self.apply_on_boot_checkbutton.set_sensitive(False)
+            self.settings_applier.set_checkbutton_sensitivity(False)
             self.settings_applier.create_systemd_service()
         else:
-            self.apply_on_boot_checkbutton.set_sensitive(False)
+            self.settings_applier.set_checkbutton_sensitivity(False)
             self.settings_applier.remove_systemd_service()
 
     def on_interval_changed(self, spinbutton):